@@ -0,0 +1,167 @@
+"""
+This init script is configured to work with the hardware setup in the Chalmers lab,
+as of January 2023.
+
+The notebooks import it for its names, e.g. `from mcc180_init import *`. Importing
+the package itself only loads the basic imports and the hardware configuration. An
+instrument is created the first time it is accessed, together with the instruments
+it depends on, so `mcc180_init.hardware_cfg` does not connect to the cluster.
+
+This initialization script has the following structure:
+
+Imports and setup (this file)
+1 basic imports
+    Here, python modules required for the experiments are imported. This includes:
+    - generic scientfic python modules (numpy, scipy, matplotlib, etc. ).
+    - specific experiment modules (quantify-core, quantify-scheduler,
+      superconducting_qubit_tools, etc.)
+    - instrument driver classes required for the experiment (qcodes instruments and
+      quantify specific instruments)
+2 specify hardware configuration
+    The hardware configuration contains information about the connectivity of the hardware
+    to the device, as well as hardware-specific settings (see Quantify-Scheduler documentation)
+Instruments (_bootstrap.py)
+3 configure basic settings
+    Here, we specify the desired data directory
+4 Instantiate Instruments
+    To run an experiment, we require differt kinds of instruments. See also the
+    documentation of quantify-scheduler
+    - Physical instruments -> these are the QCoDeS drivers for corresponding to the
+      instruments in the setup.
+    - Hardware abstraction layer -> the InstrumentCoordinator and ICcomponents
+      responsible for providing a hardware agnostic interface to the experiment flow.
+    - Utility instruments -> measurement control and various monitoring instruments.
+    - Configuration management instruments -> QuantumDevice and the DeviceElements
+5 Loading settings from previous experiments (data) onto instruments
+"""
+# pylint: disable=wrong-import-position
+# pylint: disable=unused-import
+# pylint: disable=wrong-import-order
+# pylint: disable=(django-not-configured)
+
+############################################
+# 1. Basic imports
+############################################
+
+
+# 1.1 Generic python imports
+
+import time
+
+from ._startup_log import _flush_log, _log_elapsed
+
+# for benchmarking purposes, see _startup_log
+_t0 = time.perf_counter_ns()
+
+
+# pylint: disable=unused-import
+from pathlib import Path
+import importlib
+import numpy as np
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Heavy modules that are not needed by the init itself are only imported the
+# first time they are accessed as attributes of this module (PEP 562).
+# Maps the exposed name to (module, attribute); attribute None binds the module.
+_LAZY_IMPORTS = {
+    "plt": ("matplotlib.pyplot", None),
+    "nx": ("networkx", None),
+    "display": ("IPython.display", "display"),
+    "SVG": ("IPython.display", "SVG"),
+    # netCDF4 used to be star-imported here; its names are available through it
+    "netCDF4": ("netCDF4", None),
+    # used by the notebooks through `from mcc180_init import *`
+    "meas": ("superconducting_qubit_tools.measurement_functions", None),
+    "cal": ("superconducting_qubit_tools.calibration_functions", None),
+}
+
+# The instruments are built by _bootstrap on first access. Maps the exposed name
+# to the name of the memoized function returning it. Importing _bootstrap itself
+# is cheap.
+from . import _bootstrap
+
+# quantum_device comes first, so that a star import builds the instruments it
+# depends on while the cluster connects in the background.
+_RESOLVERS = {
+    "quantum_device": "build_quantum_device",
+    "cluster0": "connect_cluster",
+    "ic_cluster0": "build_ic_cluster0",
+    "instrument_coordinator": "build_instrument_coordinator",
+    "meas_ctrl": "build_meas_ctrl",
+    "nested_meas_ctrl": "build_nested_meas_ctrl",
+    "plotmon": "build_plotmon",
+    "plotmon_nested": "build_plotmon_nested",
+    "insmon": "build_insmon",
+    "q0": "build_q0",
+    "list_of_qubits": "build_list_of_qubits",
+}
+
+
+def __getattr__(name):
+    if name in _RESOLVERS:
+        try:
+            value = getattr(_bootstrap, _RESOLVERS[name])()
+            globals()[name] = value
+        finally:
+            _flush_log()
+        return value
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = importlib.import_module(module_name)
+        if attr is not None:
+            value = getattr(value, attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_RESOLVERS) | set(_LAZY_IMPORTS))
+
+
+# from autodepgraph import AutoDepGraph_DAG
+
+
+# 1.2 experiment transmon and quantify imports
+
+# quantify_core is imported by _bootstrap, once the data directory is set.
+
+
+# 1.3 Instrument imports
+
+# The instrument classes are resolved through lazy_heavy_imports by _bootstrap,
+# which only imports quantify / qblox_instruments once an instrument is created.
+
+_log_elapsed("basic imports", _t0)
+
+############################################
+# 2. Specify hardware configuration
+############################################
+# define the hardware configuration file for the setup [Note this format will be changed by Q1 2023!]
+# Describes the connectivity from the quantum device to the control hardware.
+
+RO_settings =  {'LO' : 5800000000, 'off_I': 0, 'off_Q': 0}
+
+
+# The configuration itself lives in hardware_cfg.json next to this file.
+hardware_cfg = _json_loads(Path(__file__).with_name("hardware_cfg.json").read_bytes())
+
+LAST_TUID = None
+
+_flush_log()
+
+# `from mcc180_init import *` resolves every name listed here, i.e. it creates all
+# instruments, as the notebooks expect.
+__all__ = [
+    "np",
+    "meas",
+    "cal",
+    "RO_settings",
+    "hardware_cfg",
+    "LAST_TUID",
+    *_RESOLVERS,
+]
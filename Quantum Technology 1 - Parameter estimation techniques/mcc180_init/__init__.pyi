@@ -0,0 +1,78 @@
+# Type stub for mcc180_init, whose instruments are only created on first access
+# through the module __getattr__.
+from typing import Any, Dict, List, Optional
+
+import matplotlib.pyplot as _plt
+import netCDF4 as netCDF4
+import networkx as _nx
+import numpy as np
+from IPython.display import SVG as SVG, display as display
+from qblox_instruments import Cluster
+from quantify_core.measurement import MeasurementControl
+from quantify_core.visualization.pyqt_plotmon import PlotMonitor_pyqt
+from quantify_scheduler.instrument_coordinator.components.qblox import (
+    ClusterComponent,
+)
+from quantify_scheduler.instrument_coordinator.instrument_coordinator import (
+    InstrumentCoordinator,
+)
+from superconducting_qubit_tools import calibration_functions as cal
+from superconducting_qubit_tools import measurement_functions as meas
+from superconducting_qubit_tools.device_under_test.quantum_device import (
+    QuantumDevice,
+)
+from superconducting_qubit_tools.device_under_test.transmon_element import (
+    BasicTransmonElement,
+)
+
+from ._bootstrap import _LazyInstrument
+
+__all__ = [
+    "np",
+    "meas",
+    "cal",
+    "RO_settings",
+    "hardware_cfg",
+    "LAST_TUID",
+    "quantum_device",
+    "cluster0",
+    "ic_cluster0",
+    "instrument_coordinator",
+    "meas_ctrl",
+    "nested_meas_ctrl",
+    "plotmon",
+    "plotmon_nested",
+    "insmon",
+    "q0",
+    "list_of_qubits",
+]
+
+# lazily imported modules, see _LAZY_IMPORTS
+plt = _plt
+nx = _nx
+
+RO_settings: Dict[str, int]
+hardware_cfg: Dict[str, Any]
+LAST_TUID: Optional[str]
+
+# physical instruments
+cluster0: Cluster
+
+# hardware abstraction layer
+ic_cluster0: ClusterComponent
+instrument_coordinator: InstrumentCoordinator
+
+# utility instruments
+meas_ctrl: MeasurementControl
+nested_meas_ctrl: MeasurementControl
+plotmon: PlotMonitor_pyqt
+plotmon_nested: PlotMonitor_pyqt
+# a stand-in that creates the InstrumentMonitor on first attribute access
+insmon: _LazyInstrument
+
+# config management instruments
+q0: BasicTransmonElement
+list_of_qubits: List[BasicTransmonElement]
+quantum_device: QuantumDevice
+
+def __getattr__(name: str) -> Any: ...
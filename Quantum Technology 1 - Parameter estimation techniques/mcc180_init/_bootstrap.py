@@ -0,0 +1,318 @@
+"""
+Sections 3 to 5 of the init: the data directory and the instruments.
+
+Every public function builds one object the first time it is called and returns
+the same object afterwards. mcc180_init resolves its instrument names through
+these functions, see `mcc180_init._RESOLVERS`.
+"""
+# pylint: disable=import-outside-toplevel
+
+import functools
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable
+
+from . import lazy_heavy_imports as lazy
+from ._startup_log import _flush_log, _log, _log_elapsed
+
+
+def _memoized(builder):
+    """
+    Calls the builder once and returns its result on every later call. The lock
+    makes a caller wait for a build that is already running in another thread.
+    """
+    lock = threading.Lock()
+    result = []
+
+    @functools.wraps(builder)
+    def wrapper():
+        with lock:
+            if not result:
+                result.append(builder())
+            return result[0]
+
+    return wrapper
+
+
+def _start_in_background(builder):
+    """
+    Starts the builder on a daemon thread and returns a future for its result. Call
+    .result() on it before using the builder, so that an exception raised in the
+    thread is re-raised instead of the builder being run a second time. A daemon
+    thread does not keep the interpreter (or kernel) from exiting, e.g. while
+    connecting to an unreachable instrument.
+
+    The lazy classes have to be imported on the main thread beforehand (see
+    _import_classes): quantify and qblox_instruments import each other, and
+    importing them from two threads at once can hand one of them a partially
+    initialised module.
+    """
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(builder())
+        except BaseException as exc:  # pylint: disable=broad-except
+            # re-raised by future.result()
+            future.set_exception(exc)
+
+    threading.Thread(
+        target=run, name=f"mcc180_init.{builder.__name__}", daemon=True
+    ).start()
+    return future
+
+
+def _import_classes(*names):
+    """Imports the given lazy_heavy_imports classes on the calling thread."""
+    for name in names:
+        getattr(lazy, name)
+
+
+#############################
+# 3 configure basic settings
+#############################
+
+_HOME = Path.home()
+
+
+# set data directory
+@_memoized
+def configure_datadir():
+    from quantify_core.data.handling import get_datadir, set_datadir
+
+    set_datadir(str(_HOME / "quantify-data"))
+    datadir = get_datadir()
+    _log.append(f"\nData directory set to: {datadir}\n")
+    return datadir
+
+
+#############################
+# 4 Instantiate Instruments
+#############################
+
+# physical instruments
+#############################
+
+# Resetting re-arms the module firmware. It is skipped when the cluster reports an
+# OKAY status and was reset by this script less than a minute ago, e.g. when the
+# init is re-run right after a kernel restart.
+# N.B. the stamp only records when this script last reset the cluster, not that it
+# is still in its reset state. Anything configured on the cluster since then, e.g.
+# by a notebook in that window, is kept when the reset is skipped.
+_CLUSTER_RESET_STAMP = _HOME / ".cache" / "mcc180" / "clusterA_last_reset"
+_CLUSTER_RESET_MAX_AGE = 60  # s
+
+
+def _seconds_since_cluster_reset():
+    try:
+        return time.time() - _CLUSTER_RESET_STAMP.stat().st_mtime
+    except OSError:
+        # no (readable) stamp, so reset
+        return float("inf")
+
+
+def _record_cluster_reset():
+    try:
+        _CLUSTER_RESET_STAMP.parent.mkdir(parents=True, exist_ok=True)
+        _CLUSTER_RESET_STAMP.touch()
+    except OSError:
+        # e.g. a read-only home directory; the next init then resets again
+        pass
+
+
+@_memoized
+def connect_cluster():
+    _log.append("connecting to qblox-cluster-MM.")
+    # shown right away, as connecting may take a while
+    _flush_log()
+    cluster = lazy.Cluster("clusterA", "192.0.2.142")
+    system_state = cluster.get_system_state()
+    _log.append(f"CMM system status is \n {system_state}")
+    _log.append("correctly connected to qblox-cluster-MM.\n")
+    # Reset
+    if (
+        system_state.status != lazy.SystemStatus.OKAY
+        or _seconds_since_cluster_reset() > _CLUSTER_RESET_MAX_AGE
+    ):
+        cluster.reset()
+        _record_cluster_reset()
+    return cluster
+
+
+# from qblox_instruments.qcodes_drivers.spi_rack import SpiRack
+# SPI_RACK_ADDR = "COM6"
+# spi = SpiRack("spi", SPI_RACK_ADDR)
+# spi.add_spi_module(3, "S4g")
+
+# Signal hound spectrum analyzer.
+# N.B. Comment this line if you want to use the SH GUI!
+# from superconducting_qubit_tools.instruments import USB_SA124B as usb
+# signal_hound = usb.SignalHound_USB_SA124B("signal_hound")
+# print("\n SignalHound ready")
+
+# hardware abstraction layer
+#############################
+
+
+@_memoized
+def build_ic_cluster0():
+    return lazy.ClusterComponent(connect_cluster())
+
+
+@_memoized
+def build_instrument_coordinator():
+    instrument_coordinator = lazy.InstrumentCoordinator("instrument_coordinator")
+    instrument_coordinator.add_component(build_ic_cluster0())
+    return instrument_coordinator
+
+
+# utility instruments
+#############################
+
+
+class _LazyInstrument:
+    """
+    Stand-in for an instrument that is only created on first attribute access,
+    e.g. insmon.update(). The name is available without creating it.
+    """
+
+    def __init__(self, constructor: Callable[[str], Any], name: str) -> None:
+        self.name = name
+        self._constructor = constructor
+        self._instrument = None
+
+    def _resolve(self) -> Any:
+        if self._instrument is None:
+            self._instrument = self._constructor(self.name)
+        return self._instrument
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self._resolve(), attr)
+
+    def __repr__(self) -> str:
+        if self._instrument is None:
+            return f"<{type(self).__name__}: {self.name} (not created yet)>"
+        return repr(self._instrument)
+
+
+# Create the live plotting intrument which handles the graphical interface
+# Two windows will be created, the main will feature 1D plots and any 2D plots will go
+# to the secondary
+@_memoized
+def build_plotmon():
+    return lazy.PlotMonitor_pyqt("plotmon")
+
+
+@_memoized
+def build_plotmon_nested():
+    return lazy.PlotMonitor_pyqt("plotmon_nested")
+
+
+@_memoized
+def build_meas_ctrl():
+    configure_datadir()
+    meas_ctrl = lazy.MeasurementControl("meas_ctrl")
+    # Connect the live plotting monitor to the measurement control
+    meas_ctrl.instr_plotmon(build_plotmon().name)
+    return meas_ctrl
+
+
+@_memoized
+def build_nested_meas_ctrl():
+    configure_datadir()
+    nested_meas_ctrl = lazy.MeasurementControl("nested_meas_ctrl")
+    # Connect the live plotting monitor to the measurement control
+    nested_meas_ctrl.instr_plotmon(build_plotmon_nested().name)
+    return nested_meas_ctrl
+
+
+# The instrument monitor will give an overview of all parameters of all instruments
+# It is only created (and its window opened) on first use of insmon, as nothing
+# else refers to it.
+# N.B. leave insmon.update_snapshot at its default (False): the monitor then reads
+# the parameter cache. qblox_instruments has no bulk read, so True would query
+# every cluster parameter over SCPI, one round-trip at a time, on each refresh.
+@_memoized
+def build_insmon():
+    return _LazyInstrument(lazy.InstrumentMonitor, "insmon")
+
+
+# Config management instruments
+#############################
+
+
+# N.B. q0 is always built from scratch. qcodes instruments refuse to be pickled and
+# must register themselves by name on construction, so a pickled q0 cannot be
+# reused across sessions. Persist its settings with load_settings_onto_instrument
+# (section 5) instead.
+@_memoized
+def build_q0():
+    return lazy.BasicTransmonElement("q00")
+
+
+@_memoized
+def build_list_of_qubits():
+    return [build_q0()]
+
+
+#####################################
+# 5 Loading settings onto instruments
+#####################################
+
+
+@_memoized
+def build_quantum_device():
+    from . import hardware_cfg
+
+    t0 = time.perf_counter_ns()
+    # Only connecting to the cluster can overlap with the rest: the measurement
+    # controls create their plot monitors, which start a Qt process and so have to
+    # be built on this thread.
+    _import_classes(
+        "Cluster",
+        "SystemStatus",
+        "ClusterComponent",
+        "InstrumentCoordinator",
+        "MeasurementControl",
+        "PlotMonitor_pyqt",
+        "QuantumDevice",
+        "BasicTransmonElement",
+    )
+    instrument_coordinator_future = _start_in_background(build_instrument_coordinator)
+
+    quantum_device = lazy.QuantumDevice(name="quantum_device")
+
+    quantum_device.instr_measurement_control(build_meas_ctrl().name)
+    list_of_qubits = build_list_of_qubits()
+    quantum_device.instr_instrument_coordinator(
+        instrument_coordinator_future.result().name
+    )
+    _log_elapsed("loading instruments", t0)
+
+    # N.B. hardware_cfg has to stay a plain dict: the hardware_config parameter is
+    # validated with vals.Dict(), and the config ends up in JSON snapshots.
+    quantum_device.hardware_config(hardware_cfg)
+
+    for qubit in list_of_qubits:
+        quantum_device.add_element(qubit)
+
+        # # loads settings from the last datafile onto these instruments
+        # from quantify_core.utilities.experiment_helpers import (
+        #     load_settings_onto_instrument,
+        # )
+        # try:
+        #     load_settings_onto_instrument(instrument=qubit, tuid=LAST_TUID)
+        # except ValueError:
+        #     print(f"Failed loading {qubit}")
+        #     continue
+
+    # load_settings_onto_instrument(instrument=spi, tuid=LAST_TUID)
+
+    # load_settings_onto_instrument(instrument=connect_cluster(), tuid=LAST_TUID)
+
+    _log_elapsed("loading settings", t0)
+    return quantum_device
@@ -0,0 +1,35 @@
+"""
+Startup messages of mcc180_init and _bootstrap.
+
+Messages are collected in `_log` and written to stdout in one go by `_flush_log`,
+instead of one print() (and one kernel message in Jupyter) each. Both modules
+import the list from here, so reload(mcc180_init) keeps appending to it.
+"""
+
+import os
+import sys
+import threading
+import time
+
+# for benchmarking purposes, set the MCC180_PROFILE environment variable (to anything
+# but 0) to print how long each stage of the init takes
+_PROFILE = os.environ.get("MCC180_PROFILE", "") not in ("", "0")
+
+_log = []
+_log_lock = threading.Lock()
+
+
+def _log_elapsed(stage, t0):
+    """Logs the time since t0, a time.perf_counter_ns() value, if profiling."""
+    if _PROFILE:
+        _log.append(f"Finished {stage} {(time.perf_counter_ns() - t0) / 1e9:.2f} s")
+
+
+def _flush_log():
+    with _log_lock:
+        # other threads may still append; only remove the lines written here
+        lines = _log[:]
+        del _log[: len(lines)]
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
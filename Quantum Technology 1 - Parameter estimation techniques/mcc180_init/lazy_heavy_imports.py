@@ -0,0 +1,79 @@
+"""
+Lazy access to the heavy instrument and quantify classes used by mcc180_init.
+
+Importing quantify-core, quantify-scheduler, qblox-instruments and
+superconducting_qubit_tools pulls in Qt, qcodes and the scheduler backends.
+The classes below are only imported the first time they are accessed, e.g.
+`lazy.Cluster(...)`, so importing mcc180_init for its constants alone stays cheap.
+"""
+# pylint: disable=import-outside-toplevel
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qblox_instruments import Cluster, SystemStatus
+    from quantify_core.measurement import MeasurementControl
+    from quantify_core.visualization.instrument_monitor import InstrumentMonitor
+    from quantify_core.visualization.pyqt_plotmon import PlotMonitor_pyqt
+    from quantify_scheduler.instrument_coordinator.components.qblox import (
+        ClusterComponent,
+    )
+    from quantify_scheduler.instrument_coordinator.instrument_coordinator import (
+        InstrumentCoordinator,
+    )
+    from superconducting_qubit_tools.device_under_test.quantum_device import (
+        QuantumDevice,
+    )
+    from superconducting_qubit_tools.device_under_test.transmon_element import (
+        BasicTransmonElement,
+    )
+
+# Maps the exposed name to the (module, attribute) it is imported from.
+_LAZY = {
+    "Cluster": ("qblox_instruments", "Cluster"),
+    "SystemStatus": ("qblox_instruments", "SystemStatus"),
+    "ClusterComponent": (
+        "quantify_scheduler.instrument_coordinator.components.qblox",
+        "ClusterComponent",
+    ),
+    "InstrumentCoordinator": (
+        "quantify_scheduler.instrument_coordinator.instrument_coordinator",
+        "InstrumentCoordinator",
+    ),
+    "MeasurementControl": ("quantify_core.measurement", "MeasurementControl"),
+    "PlotMonitor_pyqt": (
+        "quantify_core.visualization.pyqt_plotmon",
+        "PlotMonitor_pyqt",
+    ),
+    "InstrumentMonitor": (
+        "quantify_core.visualization.instrument_monitor",
+        "InstrumentMonitor",
+    ),
+    "QuantumDevice": (
+        "superconducting_qubit_tools.device_under_test.quantum_device",
+        "QuantumDevice",
+    ),
+    "BasicTransmonElement": (
+        "superconducting_qubit_tools.device_under_test.transmon_element",
+        "BasicTransmonElement",
+    ),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))